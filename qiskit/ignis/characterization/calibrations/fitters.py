@@ -35,9 +35,8 @@ class RabiFitter(IQFitter):
             fit_po is [amp, freq, phase, offset]
         """
 
-        schedule_names = []
-        for cind, _ in enumerate(xdata):
-            schedule_names.append('rabicircuit_%d_' % cind)
+        schedule_names = ['rabicircuit_%d_' % cind
+                          for cind, _ in enumerate(xdata)]
 
         IQFitter.__init__(self, '$Rabi$',
                           backend_result, xdata,
@@ -146,13 +145,12 @@ class DragFitter(IQFitter):
             fit_p0 is [a, x0, c] where the fit is a*(x-x0)^2+c
         """
 
-        schedule_names = []
-        for cind, _ in enumerate(xdata):
-            schedule_names.append('dragcircuit_%d_' % cind)
+        schedule_names = ['dragcircuit_%d_' % cind
+                          for cind, _ in enumerate(xdata)]
 
         if fit_bounds is None:
-            fit_bounds = ([-np.inf for e in range(len(fit_p0))],
-                          [np.inf for e in range(len(fit_p0))])
+            fit_bounds = (np.full(len(fit_p0), -np.inf),
+                          np.full(len(fit_p0), np.inf))
 
         IQFitter.__init__(self, '$DRAG$',
                           backend_result, xdata,
@@ -18,11 +18,14 @@ Utility functions for calibrating IBMQ Devices
 
 from collections import defaultdict
 import numpy as np
-from scipy.optimize import least_squares
 from qiskit.pulse import SamplePulse, pulse_lib, Schedule, FrameChange
 from qiskit.pulse.schedule import ParameterizedSchedule
 from qiskit.pulse.commands import FrameChangeInstruction
 
+# fixed phase applied to the fitted drag pulse, hoisted out of
+# _fit_drag_func since the optimizer evaluates it many times
+_DRAG_PHASE = np.exp(-1j*np.pi/2)
+
 
 def _fit_drag_func(duration, amp, sigma, beta, exp_samples):
     """
@@ -42,9 +45,15 @@ def _fit_drag_func(duration, amp, sigma, beta, exp_samples):
     """
 
     fit_pulse = pulse_lib.drag(duration=duration, amp=amp, sigma=sigma,
-                               beta=beta).samples*np.exp(-1j*np.pi/2)
+                               beta=beta).samples*_DRAG_PHASE
 
-    return np.concatenate((fit_pulse.real, fit_pulse.imag))-exp_samples
+    # fill a preallocated residual vector in place rather than
+    # concatenating and subtracting through temporaries
+    residual = np.empty(2*duration)
+    residual[:duration] = fit_pulse.real
+    residual[duration:] = fit_pulse.imag
+    residual -= exp_samples
+    return residual
 
 
 def get_single_q_pulse(cmd_def, qubits):
@@ -62,6 +71,8 @@ def get_single_q_pulse(cmd_def, qubits):
         Deprecated once parameterized pulses are supported
     """
 
+    from scipy.optimize import least_squares
+
     fit_params = []
 
     for q in qubits:
@@ -132,27 +143,25 @@ def update_u_gates(drag_params, pi2_pulse_schedules=None,
         pulse_dur = x90_pulse.duration
 
         # find channel dependency for u2
-        for _u2_group in _find_channel_groups('u2',
-                                              qubits=qubit,
-                                              cmd_def=cmd_def):
-            if drive_ch in _u2_group:
-                break
-        else:
-            _u2_group = (drive_ch, )
+        _u2_group = next((group for group
+                          in _find_channel_groups('u2',
+                                                  qubits=qubit,
+                                                  cmd_def=cmd_def)
+                          if drive_ch in group),
+                         (drive_ch, ))
 
         u2_fc1s = [parametrized_fc('P1', np.pi/2, ch, 0)
                    for ch in _u2_group]
         u2_fc2s = [parametrized_fc('P0', -np.pi/2, ch, pulse_dur)
                    for ch in _u2_group]
 
-        # find channel dependency for u2
-        for _u3_group in _find_channel_groups('u3',
-                                              qubits=qubit,
-                                              cmd_def=cmd_def):
-            if drive_ch in _u3_group:
-                break
-        else:
-            _u3_group = (drive_ch, )
+        # find channel dependency for u3
+        _u3_group = next((group for group
+                          in _find_channel_groups('u3',
+                                                  qubits=qubit,
+                                                  cmd_def=cmd_def)
+                          if drive_ch in group),
+                         (drive_ch, ))
 
         u3_fc1s = [parametrized_fc('P2', 0, ch, 0) for ch in _u3_group]
         u3_fc2s = [parametrized_fc('P0', np.pi, ch, pulse_dur)
@@ -193,7 +202,7 @@ def _find_channel_groups(command, qubits, cmd_def):
     """
     params = cmd_def.get_parameters(command, qubits=qubits)
     temp_sched = cmd_def.get(command, qubits=qubits,
-                             **dict(zip(params, np.zeros(len(params)))))
+                             **{param: 0 for param in params})
 
     synced_fcs = defaultdict(list)
     for t0, inst in temp_sched.instructions:
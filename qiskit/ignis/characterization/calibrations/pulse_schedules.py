@@ -17,6 +17,7 @@ Pulse Schedule Generation for calibration experiments
 """
 
 import copy
+from functools import lru_cache
 import numpy as np
 import qiskit
 import qiskit.pulse as pulse
@@ -25,6 +26,24 @@ from qiskit.circuit import Gate
 from qiskit.scheduler import schedule_circuit, ScheduleConfig
 
 
+@lru_cache(maxsize=None)
+def _gaussian_pulse(duration, amp, sigma):
+    """
+    Build (and cache) a gaussian sample pulse, so that repeated
+    parameters reuse one waveform instead of regenerating the samples
+    """
+    return pulse_lib.gaussian(duration=duration, amp=amp, sigma=sigma)
+
+
+@lru_cache(maxsize=None)
+def _drag_pulse(duration, amp, beta, sigma):
+    """
+    Build (and cache) a drag sample pulse, so that repeated
+    parameters reuse one waveform instead of regenerating the samples
+    """
+    return pulse_lib.drag(duration=duration, amp=amp, beta=beta, sigma=sigma)
+
+
 def rabi_schedules(amp_list, qubits, pulse_width, pulse_sigma=None,
                    width_sigma_ratio=4, drives=None, cmd_def=None,
                    meas_map=None):
@@ -60,6 +79,12 @@ def rabi_schedules(amp_list, qubits, pulse_width, pulse_sigma=None,
     qr = qiskit.QuantumRegister(max(qubits) + 1)
     cr = qiskit.ClassicalRegister(len(qubits))
 
+    # the measurement block is the same for every circuit, so build it
+    # once and append it to each circuit
+    meas_circ = qiskit.QuantumCircuit(qr, cr)
+    for qind, qubit in enumerate(qubits):
+        meas_circ.measure(qr[qubit], cr[qind])
+
     circuits = []
 
     for circ_index, g_amp in enumerate(amp_list):
@@ -67,37 +92,35 @@ def rabi_schedules(amp_list, qubits, pulse_width, pulse_sigma=None,
         circ = qiskit.QuantumCircuit(qr, cr)
         circ.name = 'rabicircuit_%d_0' % circ_index
 
-        rabi_pulse = pulse_lib.gaussian(duration=pulse_width,
-                                        amp=g_amp,
-                                        sigma=pulse_sigma,
-                                        name='rabi_pulse_%d' % circ_index)
+        rabi_pulse = _gaussian_pulse(pulse_width, g_amp, pulse_sigma)
 
-        rabi_gate = Gate(name='rabi_%d' % circ_index, num_qubits=1, params=[])
+        # format the command name once, it is reused for every qubit
+        gate_name = 'rabi_%d' % circ_index
+        rabi_gate = Gate(name=gate_name, num_qubits=1, params=[])
 
         for _, qubit in enumerate(qubits):
 
-            # add commands to schedule
-            schedule = pulse.Schedule(name='rabi_pulse_%f_%d' % (g_amp,
+            # build the schedule in one shot rather than inserting
+            # into an empty schedule
+            schedule = pulse.Schedule(rabi_pulse(drives[qubit]),
+                                      name='rabi_pulse_%f_%d' % (g_amp,
                                                                  qubit))
 
-            schedule += rabi_pulse(drives[qubit])
-
             # append this schedule to the cmd_def
-            cmd_def.add('rabi_%d' % circ_index, qubits=[qubit],
+            cmd_def.add(gate_name, qubits=[qubit],
                         schedule=schedule)
 
             circ.append(rabi_gate, [qr[qubit]])
 
-        for qind, qubit in enumerate(qubits):
-            circ.measure(qr[qubit], cr[qind])
+        circ.extend(meas_circ)
 
         circuits.append(circ)
 
-        # schedule
-        schedule_config = ScheduleConfig(cmd_def, meas_map)
-        rabi_sched = [schedule_circuit(qcirc,
-                                       schedule_config)
-                      for qcirc in circuits]
+    # schedule all the circuits in one pass once the cmd_def is complete
+    schedule_config = ScheduleConfig(cmd_def, meas_map)
+    rabi_sched = [schedule_circuit(qcirc,
+                                   schedule_config)
+                  for qcirc in circuits]
 
     return rabi_sched, xdata
 
@@ -140,6 +163,12 @@ def drag_schedules(beta_list, qubits, pulse_amp, pulse_width,
     qr = qiskit.QuantumRegister(max(qubits) + 1)
     cr = qiskit.ClassicalRegister(len(qubits))
 
+    # the measurement block is the same for every circuit, so build it
+    # once and append it to each circuit
+    meas_circ = qiskit.QuantumCircuit(qr, cr)
+    for qind, qubit in enumerate(qubits):
+        meas_circ.measure(qr[qubit], cr[qind])
+
     circuits = []
 
     for circ_index, b_amp in enumerate(beta_list):
@@ -147,41 +176,37 @@ def drag_schedules(beta_list, qubits, pulse_amp, pulse_width,
         circ = qiskit.QuantumCircuit(qr, cr)
         circ.name = 'dragcircuit_%d_0' % circ_index
 
-        for qind, qubit in enumerate(qubits):
+        # format the command name once, it is reused for every qubit
+        gate_name = 'drag_%d' % circ_index
+        drag_gate = Gate(name=gate_name, num_qubits=1, params=[])
 
-            drag_pulse = pulse_lib.drag(duration=pulse_width,
-                                        amp=pulse_amp[qind],
-                                        beta=b_amp,
-                                        sigma=pulse_sigma,
-                                        name='drag_pulse_%d_%d' % (circ_index,
-                                                                   qubit))
+        for qind, qubit in enumerate(qubits):
 
-            drag_gate = Gate(name='drag_%d_%d' % (circ_index, qubit),
-                             num_qubits=1, params=[])
+            drag_pulse = _drag_pulse(pulse_width, pulse_amp[qind],
+                                     b_amp, pulse_sigma)
 
-            # add commands to schedule
-            schedule = pulse.Schedule(name='drag_pulse_%f_%d' % (b_amp,
+            # build the schedule in one shot rather than inserting
+            # into an empty schedule
+            schedule = pulse.Schedule(drag_pulse(drives[qubit]),
+                                      name='drag_pulse_%f_%d' % (b_amp,
                                                                  qubit))
 
-            schedule += drag_pulse(drives[qubit])
-
             # append this schedule to the cmd_def
-            cmd_def.add('drag_%d_%d' % (circ_index, qubit), qubits=[qubit],
+            cmd_def.add(gate_name, qubits=[qubit],
                         schedule=schedule)
 
             circ.append(drag_gate, [qr[qubit]])
             circ.u1(np.pi, [qr[qubit]])
             circ.append(drag_gate, [qr[qubit]])
 
-        for qind, qubit in enumerate(qubits):
-            circ.measure(qr[qubit], cr[qind])
+        circ.extend(meas_circ)
 
         circuits.append(circ)
 
-        # schedule
-        schedule_config = ScheduleConfig(cmd_def, meas_map)
-        drag_sched = [schedule_circuit(qcirc,
-                                       schedule_config)
-                      for qcirc in circuits]
+    # schedule all the circuits in one pass once the cmd_def is complete
+    schedule_config = ScheduleConfig(cmd_def, meas_map)
+    drag_sched = [schedule_circuit(qcirc,
+                                   schedule_config)
+                  for qcirc in circuits]
 
     return drag_sched, xdata
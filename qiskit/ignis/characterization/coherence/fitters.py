@@ -30,9 +30,8 @@ class T1Fitter(BaseCoherenceFitter):
                  fit_p0, fit_bounds,
                  time_unit='micro-seconds'):
 
-        circuit_names = []
-        for cind, _ in enumerate(xdata):
-            circuit_names.append('t1circuit_%d_' % cind)
+        circuit_names = ['t1circuit_%d_' % cind
+                         for cind, _ in enumerate(xdata)]
 
         BaseCoherenceFitter.__init__(self, '$T_1$',
                                      backend_result, xdata,
@@ -60,9 +59,8 @@ class T2Fitter(BaseCoherenceFitter):
                  qubits, fit_p0, fit_bounds, circbasename='t2',
                  time_unit='micro-seconds'):
 
-        circuit_names = []
-        for cind, _ in enumerate(xdata):
-            circuit_names.append('%scircuit_%d_' % (circbasename, cind))
+        circuit_names = ['%scircuit_%d_' % (circbasename, cind)
+                         for cind, _ in enumerate(xdata)]
 
         BaseCoherenceFitter.__init__(self, '$T_2$',
                                      backend_result,
@@ -90,9 +88,8 @@ class T2StarFitter(BaseCoherenceFitter):
                  qubits, fit_p0, fit_bounds,
                  time_unit='micro-seconds'):
 
-        circuit_names = []
-        for cind, _ in enumerate(xdata):
-            circuit_names.append('t2starcircuit_%d_' % cind)
+        circuit_names = ['t2starcircuit_%d_' % cind
+                         for cind, _ in enumerate(xdata)]
 
         BaseCoherenceFitter.__init__(self, '$T_2^*$',
                                      backend_result,
@@ -48,8 +48,8 @@ class BaseFitter:
         """
 
         if fit_bounds is None:
-            fit_bounds = ([-np.inf for e in range(len(fit_p0))],
-                          [np.inf for e in range(len(fit_p0))])
+            fit_bounds = (np.full(len(fit_p0), -np.inf),
+                          np.full(len(fit_p0), np.inf))
 
         if series is None:
             self._series = ['0']
@@ -223,8 +223,14 @@ class BaseFitter:
 
         """
 
+        # counts and shot totals per series, as tuples indexed by the
+        # circuit number so the per-qubit loop below does not need to
+        # rebuild the circuit name for every lookup
         circ_counts = {}
+        circ_shots = {}
         for _, serieslbl in enumerate(self._series):
+            series_counts = []
+            series_shots = []
             for circ, _ in enumerate(self._xdata):
                 circname = self._circuit_names[circ] + serieslbl
                 count_list = []
@@ -234,8 +240,11 @@ class BaseFitter:
                     except (QiskitError, KeyError):
                         pass
 
-                circ_counts[circname] = \
-                    build_counts_dict_from_list(count_list)
+                series_counts.append(build_counts_dict_from_list(count_list))
+                series_shots.append(sum(series_counts[-1].values()))
+
+            circ_counts[serieslbl] = tuple(series_counts)
+            circ_shots[serieslbl] = tuple(series_shots)
 
         self._ydata = {}
         for _, serieslbl in enumerate(self._series):
@@ -243,10 +252,9 @@ class BaseFitter:
             for qind, _ in enumerate(self._qubits):
                 self._ydata[serieslbl].append({'mean': [], 'std': []})
                 for circ, _ in enumerate(self._xdata):
-                    circname = self._circuit_names[circ] + serieslbl
-                    shots = sum(circ_counts[circname].values())
+                    shots = circ_shots[serieslbl][circ]
                     counts_subspace = \
-                        marginal_counts(circ_counts[circname], [qind])
+                        marginal_counts(circ_counts[serieslbl][circ], [qind])
                     success_prob = \
                         counts_subspace.get(self._expected_state, 0) / shots
                     self._ydata[serieslbl][-1]['mean'].append(success_prob)
@@ -460,8 +468,9 @@ class IQFitter(BaseFitter):
                 mean_list -= q_exp_mean
                 real_ext = np.mean(np.abs(np.real(mean_list)))
                 imag_ext = np.mean(np.abs(np.imag(mean_list)))
-                crot = real_ext/(real_ext**2+imag_ext**2)**0.5
-                srot = imag_ext/(real_ext**2+imag_ext**2)**0.5
+                iq_norm = (real_ext**2+imag_ext**2)**0.5
+                crot = real_ext/iq_norm
+                srot = imag_ext/iq_norm
                 mean_list = crot*np.real(mean_list)+srot*np.imag(mean_list)
                 self._ydata[serieslbl][-1]['mean'] = mean_list
 
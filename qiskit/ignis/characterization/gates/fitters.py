@@ -28,9 +28,8 @@ class AmpCalFitter(BaseGateFitter):
     def __init__(self, backend_result, xdata,
                  qubits, fit_p0, fit_bounds):
 
-        circuit_names = []
-        for cind, _ in enumerate(xdata):
-            circuit_names.append('ampcal1Qcircuit_%d_' % cind)
+        circuit_names = ['ampcal1Qcircuit_%d_' % cind
+                         for cind, _ in enumerate(xdata)]
 
         # theoretically
         # curve is 0.5-0.5*cos((x+1)*2*(pi/4+dphi))
@@ -98,9 +97,8 @@ class AngleCalFitter(BaseGateFitter):
     def __init__(self, backend_result, xdata,
                  qubits, fit_p0, fit_bounds):
 
-        circuit_names = []
-        for cind, _ in enumerate(xdata):
-            circuit_names.append('anglecal1Qcircuit_%d_' % cind)
+        circuit_names = ['anglecal1Qcircuit_%d_' % cind
+                         for cind, _ in enumerate(xdata)]
 
         # fit function is  0.5-0.5*sin(pi/2*x+delta*x+delta+pi/2)
 
@@ -148,9 +146,8 @@ class AmpCalCXFitter(BaseGateFitter):
     def __init__(self, backend_result, xdata,
                  qubits, fit_p0, fit_bounds):
 
-        circuit_names = []
-        for cind, _ in enumerate(xdata):
-            circuit_names.append('ampcalcxcircuit_%d_' % cind)
+        circuit_names = ['ampcalcxcircuit_%d_' % cind
+                         for cind, _ in enumerate(xdata)]
 
         # theoretically
         # curve is 0.5-0.5*cos((x+1)*2*(pi/4+dphi))
@@ -200,9 +197,8 @@ class AngleCalCXFitter(BaseGateFitter):
     def __init__(self, backend_result, xdata,
                  qubits, fit_p0, fit_bounds):
 
-        circuit_names = []
-        for cind, _ in enumerate(xdata):
-            circuit_names.append('anglecalcxcircuit_%d_' % cind)
+        circuit_names = ['anglecalcxcircuit_%d_' % cind
+                         for cind, _ in enumerate(xdata)]
 
         # fit function is  0.5-0.5*sin(pi/2*x+delta*x+delta+pi/2)
 
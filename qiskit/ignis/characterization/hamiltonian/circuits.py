@@ -16,6 +16,8 @@
 Circuit generation for measuring hamiltonian parametes
 """
 
+import itertools
+
 import numpy as np
 import qiskit
 from ..characterization_utils import pad_id_gates
@@ -60,22 +62,27 @@ def zz_circuits(num_of_gates, gate_time, qubits, spectators, nosc=5):
 
     circuits = []
 
-    for qflip in [False, True]:
-        for circ_index, circ_length in enumerate(num_of_gates):
-            circ = qiskit.QuantumCircuit(qr, cr)
-            circ.name = 'zzcircuit_' + str(circ_index) + '_%d' % qflip
+    # the measurement block is the same for every circuit, so build it
+    # once and append it to each circuit
+    meas_circ = qiskit.QuantumCircuit(qr, cr)
+    for qind, qubit in enumerate(qubits):
+        meas_circ.measure(qr[qubit], cr[qind])
+
+    for qflip, (circ_index, circ_length) in \
+            itertools.product([False, True], enumerate(num_of_gates)):
+        circ = qiskit.QuantumCircuit(qr, cr)
+        circ.name = 'zzcircuit_' + str(circ_index) + '_%d' % qflip
+        if qflip:
             for _, qspec in enumerate(spectators):
-                if qflip:
-                    circ.x(qr[qspec])
-            circ.barrier(qr)
-            for qind, qubit in enumerate(qubits):
-                circ.h(qr[qubit])
-                circ = pad_id_gates(circ, qr, qubit, circ_length)
-                circ.u1(2*np.pi*osc_freq*xdata[circ_index], qr[qubit])
-                circ.h(qr[qubit])
-            circ.barrier(qr)
-            for qind, qubit in enumerate(qubits):
-                circ.measure(qr[qubit], cr[qind])
-            circuits.append(circ)
+                circ.x(qr[qspec])
+        circ.barrier(qr)
+        for qind, qubit in enumerate(qubits):
+            circ.h(qr[qubit])
+            circ = pad_id_gates(circ, qr, qubit, circ_length)
+            circ.u1(2*np.pi*osc_freq*xdata[circ_index], qr[qubit])
+            circ.h(qr[qubit])
+        circ.barrier(qr)
+        circ.extend(meas_circ)
+        circuits.append(circ)
 
     return circuits, xdata, osc_freq
@@ -30,9 +30,8 @@ class ZZFitter(BaseCoherenceFitter):
                  fit_p0, fit_bounds,
                  time_unit='micro-seconds'):
 
-        circuit_names = []
-        for cind, _ in enumerate(xdata):
-            circuit_names.append('zzcircuit_%d_' % cind)
+        circuit_names = ['zzcircuit_%d_' % cind
+                         for cind, _ in enumerate(xdata)]
 
         self._spectators = spectators
 
@@ -54,7 +54,7 @@ class DiscriminationFilter:
         """
         self.discriminator = discriminator
 
-        if base:
+        if base is not None:
             self.base = base
         else:
             self.base = DiscriminationFilter.get_base(